@@ -4,6 +4,8 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     MONGODB_URI: str
     DATABASE_NAME: str
+    # Serialize ETL output through polars instead of pandas (requires polars)
+    USE_POLARS: bool = False
 
     class Config:
         env_file = ".env"
@@ -2,8 +2,9 @@
 
 import os
 import time
+import tempfile
 import pandas as pd
-from .file_handlers import READERS
+from .file_handlers import READERS, BYTES_READERS
 from .smart_readers import smart_read_parts
 
 
@@ -77,34 +78,71 @@ def extract_data(file_path, return_fragments=False):
                 df = pd.DataFrame()
         else:
             df = reader(file_path)
-            # Simple fragment detection for other types
-            parsed_fragments = {
-                "json_fragments": 1 if file_type == "json" else 0,
-                "html_tables": 1 if file_type == "html" else 0,
-                "csv_fragments": 1 if file_type in ["csv", "tsv"] else 0,
-                "kv_pairs": 0,
-                "raw_text": 0
-            }
+            parsed_fragments = _simple_fragments(file_type)
         
         duration = time.time() - start_time
 
-        # Flatten nested JSON if detected
-        if file_type == "json" and not df.empty:
+        df = _finish_extraction(df, file_type, file_path, duration)
+
+        if return_fragments:
+            return df, parsed_fragments
+        return df
+
+    except Exception as e:
+        print(f"❌ Error during extraction: {e}")
+        if return_fragments:
+            return pd.DataFrame(), {}
+        return pd.DataFrame()
+
+
+def extract_data_from_bytes(file_bytes, ext, return_fragments=False):
+    """
+    Extracts data from in-memory file bytes.
+
+    Formats with a bytes reader (csv/tsv/json/parquet) are parsed directly
+    from memory; anything whose reader needs a filesystem path (pdf, xls,
+    txt, ...) is written once to a temp file and handed to extract_data.
+
+    Args:
+        file_bytes: Raw file contents
+        ext: File extension, with or without the leading dot
+        return_fragments: If True, also return parsed_fragments_summary
+
+    Returns:
+        DataFrame or tuple (DataFrame, parsed_fragments_summary)
+    """
+    file_type = ext.lower().replace('.', '')
+    reader = BYTES_READERS.get(file_type)
+
+    if reader is None:
+        fd, tmp_path = tempfile.mkstemp(suffix=f".{file_type}" if file_type else "")
+        try:
+            # Unbuffered write straight from the caller's buffer
+            view = memoryview(file_bytes)
+            while view:
+                view = view[os.write(fd, view):]
+            os.close(fd)
+            fd = None
+            return extract_data(tmp_path, return_fragments=return_fragments)
+        finally:
+            if fd is not None:
+                os.close(fd)
             try:
-                df = pd.json_normalize(df.to_dict(orient="records"))
-            except Exception:
+                os.remove(tmp_path)
+            except OSError:
                 pass
 
-        record_count = len(df)
-        print(f"✅ Extracted {record_count} records from {file_path} in {duration:.2f}s")
+    try:
+        print(f"\n📂 Detected file type: {file_type.upper()}")
 
-        if not df.empty:
-            print(df.head())
-        else:
-            print("⚠️ No data extracted.")
+        start_time = time.time()
+        df = reader(file_bytes)
+        duration = time.time() - start_time
+
+        df = _finish_extraction(df, file_type, "upload", duration)
 
         if return_fragments:
-            return df, parsed_fragments
+            return df, _simple_fragments(file_type)
         return df
 
     except Exception as e:
@@ -114,6 +152,37 @@ def extract_data(file_path, return_fragments=False):
         return pd.DataFrame()
 
 
+def _simple_fragments(file_type):
+    """Fragment summary for single-format files."""
+    return {
+        "json_fragments": 1 if file_type == "json" else 0,
+        "html_tables": 1 if file_type == "html" else 0,
+        "csv_fragments": 1 if file_type in ["csv", "tsv"] else 0,
+        "kv_pairs": 0,
+        "raw_text": 0
+    }
+
+
+def _finish_extraction(df, file_type, source, duration):
+    """Flattens nested JSON and reports the extraction result."""
+    # Flatten nested JSON if detected
+    if file_type == "json" and not df.empty:
+        try:
+            df = pd.json_normalize(df.to_dict(orient="records"))
+        except Exception:
+            pass
+
+    record_count = len(df)
+    print(f"✅ Extracted {record_count} records from {source} in {duration:.2f}s")
+
+    if not df.empty:
+        print(df.head())
+    else:
+        print("⚠️ No data extracted.")
+
+    return df
+
+
 # ==========================================================
 # Standalone Runner (Optional)
 # ==========================================================
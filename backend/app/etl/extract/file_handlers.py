@@ -1,12 +1,72 @@
+import io
 import json
+import re
 import pandas as pd
 import logging
 from .smart_readers import smart_read_combined
 from .pdf_readers import read_pdf_tables, read_pdf_text_ocr
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import lxml
+except ImportError:
+    lxml = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pc = None
+    pa_csv = None
+
 logger = logging.getLogger(__name__)
 
 
+# 19+ digit runs may be integers beyond 64 bits, which orjson silently turns into floats
+_WIDE_INT_RE = re.compile(rb"\d{19,}")
+
+
+def _dumps_json(value):
+    """Serialize a nested value to a JSON string (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits
+            pass
+    # Same compact, non-escaped format orjson writes
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _loads_json(raw):
+    """
+    Parse JSON bytes with orjson, falling back to stdlib json for inputs orjson
+    rejects (e.g. NaN) or cannot represent exactly (integers beyond 64 bits).
+    """
+    if orjson is not None and not _WIDE_INT_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _loads_ndjson(raw):
+    """
+    Parse newline-delimited JSON bytes into a list of records.
+    Lines are parsed independently so each record keeps its own shape and types.
+    """
+    return [_loads_json(line) for line in raw.splitlines() if line.strip()]
+
+
 # ----------------------------------
 # SAFE JSON PARSER (solves your error)
 # ----------------------------------
@@ -24,6 +84,22 @@ def safe_json_to_df(data):
 
     # Case 1: List of dicts
     if isinstance(data, list):
+        if data and all(isinstance(item, dict) for item in data):
+            # pd.DataFrame builds the columns directly; json_normalize(max_level=0)
+            # would flatten nothing and deep-copies every record in Python
+            df = pd.DataFrame(data)
+
+            # Stringify nested objects column by column
+            for col in df.columns[df.dtypes == object]:
+                values = df[col]
+                if values.map(lambda v: isinstance(v, (dict, list))).any():
+                    df[col] = values.map(
+                        lambda v: _dumps_json(v) if isinstance(v, (dict, list)) else v
+                    )
+
+            return df
+
+        # Heterogeneous list: fall back to row-by-row normalization
         normalized = []
 
         for item in data:
@@ -31,7 +107,7 @@ def safe_json_to_df(data):
                 row = {}
                 for k, v in item.items():
                     if isinstance(v, (dict, list)):
-                        row[k] = json.dumps(v)
+                        row[k] = _dumps_json(v)
                     else:
                         row[k] = v
                 normalized.append(row)
@@ -42,19 +118,12 @@ def safe_json_to_df(data):
 
     # Case 2: Dict of arrays / single values
     if isinstance(data, dict):
-        max_len = max(
-            (len(v) for v in data.values() if isinstance(v, list)),
-            default=1
-        )
-
-        cleaned = {}
-        for key, value in data.items():
-            if isinstance(value, list):
-                padded = value + [None] * (max_len - len(value))
-                cleaned[key] = padded
-            else:
-                # duplicate single value to match rows
-                cleaned[key] = [value] + [None] * (max_len - 1)
+        # Shorter arrays (and single values, which fill the first row only)
+        # are padded with nulls by pandas' index alignment
+        cleaned = {
+            key: pd.Series(value) if isinstance(value, list) else pd.Series([value])
+            for key, value in data.items()
+        }
 
         return pd.DataFrame(cleaned)
 
@@ -62,11 +131,14 @@ def safe_json_to_df(data):
     return pd.DataFrame([data])
 
 
-def read_json(path):
-    """Unified safe JSON handler."""
+def read_json_bytes(raw):
+    """Safe JSON handler for in-memory bytes (single document or NDJSON)."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        try:
+            data = _loads_json(raw)
+        except ValueError:
+            # Not a single JSON document: try newline-delimited JSON
+            data = _loads_ndjson(raw)
 
         return safe_json_to_df(data)
 
@@ -75,27 +147,125 @@ def read_json(path):
         return pd.DataFrame()
 
 
+def read_json(path):
+    """Unified safe JSON handler."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except Exception as e:
+        logger.error(f"JSON parsing failed: {e}")
+        return pd.DataFrame()
+
+    return read_json_bytes(raw)
+
+
 # ----------------------------------
-# HTML / XML SAFE READERS
+# CSV / TSV READERS (multi-threaded pyarrow, pandas fallback)
 # ----------------------------------
 
-def read_html_safely(path):
-    try:
-        tables = pd.read_html(path, flavor="bs4", parser="lxml")
-        if tables:
-            return tables[0]
-    except Exception:
-        pass
+# Floats at or above this magnitude can no longer represent every integer exactly
+_MAX_EXACT_FLOAT_INT = 2 ** 53
 
-    try:
-        tables = pd.read_html(path, flavor="bs4", parser="html5lib")
-        if tables:
-            return tables[0]
-    except Exception:
-        pass
+# pd.read_csv's default na_values
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+
+def _read_delimited_arrow(source, sep, in_memory):
+    """
+    pyarrow CSV read that mirrors pd.read_csv's output.
+    Returns None when the file needs pandas' handling (duplicate or blank
+    headers, non-UTF-8 text).
+    """
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=1 << 22)
+    parse_options = pa_csv.ParseOptions(delimiter=sep)
+    convert_options = pa_csv.ConvertOptions(
+        null_values=_PANDAS_NA_VALUES, strings_can_be_null=True
+    )
+
+    def _read():
+        src = pa.BufferReader(source) if in_memory else source
+        return pa_csv.read_csv(src, read_options, parse_options, convert_options)
+
+    table = _read()
+
+    # pandas de-duplicates headers (a, a.1) and names blank ones "Unnamed: N";
+    # pyarrow keeps them as is
+    names = table.column_names
+    if len(set(names)) < len(names) or not all(names):
+        return None
+
+    # Invalid UTF-8 comes back as binary columns; pd.read_csv raises on it instead
+    if any(pa.types.is_binary(f.type) or pa.types.is_large_binary(f.type) for f in table.schema):
+        return None
+
+    # Keep date/time text as strings (like pandas) so the transform layer parses them
+    temporal = [f.name for f in table.schema if pa.types.is_temporal(f.type)]
+
+    # Integers wider than 64 bits are inferred as double and lose precision;
+    # re-read large-magnitude float columns as text to check
+    wide = [
+        f.name for f in table.schema
+        if pa.types.is_floating(f.type)
+        and (pc.max(pc.abs(table[f.name])).as_py() or 0) >= _MAX_EXACT_FLOAT_INT
+    ]
+
+    if temporal or wide:
+        convert_options.column_types = {name: pa.string() for name in temporal + wide}
+        table = _read()
+
+    df = table.to_pandas()
+
+    # Like pandas: all-integer columns without nulls become uint64 when they fit,
+    # exact Python ints otherwise; columns with nulls stay exact strings;
+    # real floats are parsed back
+    for name in wide:
+        text = df[name]
+        if not text.dropna().astype(str).str.fullmatch(r"[+-]?\d+").all():
+            df[name] = pd.to_numeric(text)
+        elif not text.isna().any():
+            ints = [int(v) for v in text]
+            if all(0 <= v < 2 ** 64 for v in ints):
+                df[name] = pd.Series(ints, index=df.index, dtype="uint64")
+            else:
+                df[name] = pd.Series(ints, index=df.index, dtype=object)
 
+    return df
+
+
+def read_delimited(source, sep=","):
+    """
+    Parse a delimited file (path or raw bytes) with pyarrow's multi-threaded
+    reader. Falls back to pandas when pyarrow is missing or rejects the file
+    (e.g. ragged rows, duplicate or blank headers, non-UTF-8 text).
+    """
+    in_memory = isinstance(source, (bytes, bytearray, memoryview))
+
+    if pa_csv is not None:
+        try:
+            df = _read_delimited_arrow(source, sep, in_memory)
+            if df is not None:
+                return df
+        except Exception as e:
+            logger.debug(f"pyarrow CSV read failed, using pandas: {e}")
+
+    return pd.read_csv(io.BytesIO(source) if in_memory else source, sep=sep)
+
+
+# ----------------------------------
+# HTML / XML SAFE READERS
+# ----------------------------------
+
+def read_html_safely(path):
+    """
+    Read the first HTML table with a single pd.read_html pass (lxml parser),
+    instead of retrying the whole document with several parsers.
+    """
     try:
-        tables = pd.read_html(path)
+        tables = pd.read_html(path, flavor="lxml" if lxml is not None else None)
         if tables:
             return tables[0]
     except Exception as e:
@@ -118,14 +288,22 @@ def read_xml_safely(path):
 
 READERS = {
     "json": read_json,
-    "csv": pd.read_csv,
+    "csv": read_delimited,
     "txt": lambda path: smart_read_combined(path),
     "html": lambda path: read_html_safely(path),
     "md": lambda path: smart_read_combined(path),
     "xml": lambda path: read_xml_safely(path),
     "xlsx": lambda path: pd.read_excel(path, engine="openpyxl"),
     "xls": lambda path: pd.read_excel(path, engine="xlrd", dtype=str),
-    "tsv": lambda path: pd.read_csv(path, sep="\t"),
+    "tsv": lambda path: read_delimited(path, sep="\t"),
     "pdf": lambda path: (read_pdf_tables(path) or read_pdf_text_ocr(path)),
     "parquet": pd.read_parquet,
 }
+
+# Readers that can parse uploaded bytes directly, without a temp file
+BYTES_READERS = {
+    "json": read_json_bytes,
+    "csv": read_delimited,
+    "tsv": lambda raw: read_delimited(raw, sep="\t"),
+    "parquet": lambda raw: pd.read_parquet(io.BytesIO(raw)),
+}
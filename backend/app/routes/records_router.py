@@ -1,11 +1,29 @@
 # app/routes/records_router.py
 
+import re
+from functools import lru_cache
+
+from bson import ObjectId
 from fastapi import APIRouter, Query, HTTPException
 from app.database import db
-from app.utils.mongo import clean_mongo_document
+from app.utils.mongo import with_str_object_ids
 
 router = APIRouter(prefix="/records", tags=["Records"])
 
+# Records collection that decodes ObjectIds to str inside the BSON decoder
+records = with_str_object_ids(db.records)
+
+# Fields written by the upload pipeline; limits what the driver has to decode
+RECORD_PROJECTION = {"source_id": 1, "schema_version": 1, "data": 1, "uploaded_at": 1}
+
+# 24-char hex string: the only form ObjectId(str) accepts
+_OID_RE = re.compile(r"[0-9a-fA-F]{24}")
+
+
+@lru_cache(maxsize=1024)
+def _to_object_id(record_id: str) -> ObjectId:
+    return ObjectId(record_id)
+
 
 @router.get("/")
 async def get_records(
@@ -17,16 +35,19 @@ async def get_records(
     This uses the `records` collection filled during ETL upload.
     """
 
-    cursor = (
-        db.records
-        .find({"source_id": source_id})
-        .sort("uploaded_at", -1)
-        .limit(limit)
-    )
+    # Projection runs server-side so the driver only decodes the fields we return;
+    # _id comes back as str from the collection's codec options.
+    # No hint: $match + $sort are served by the (source_id, uploaded_at) index when
+    # it exists, and a hint naming a missing index would fail the query outright.
+    pipeline = [
+        {"$match": {"source_id": source_id}},
+        {"$sort": {"uploaded_at": -1}},
+        {"$limit": limit},
+        {"$project": RECORD_PROJECTION},
+    ]
+    cursor = records.aggregate(pipeline, batchSize=min(limit, 500))
 
-    results = []
-    async for doc in cursor:
-        results.append(clean_mongo_document(doc))
+    results = await cursor.to_list(length=limit)
 
     if not results:
         raise HTTPException(status_code=404, detail="No records found for this source_id")
@@ -44,16 +65,14 @@ async def get_single_record(record_id: str):
     Fetch a single cleaned record by Mongo _id.
     """
 
-    from bson import ObjectId
-
-    try:
-        oid = ObjectId(record_id)
-    except Exception:
+    if not _OID_RE.fullmatch(record_id):
         raise HTTPException(status_code=400, detail="Invalid record_id format")
 
-    doc = await db.records.find_one({"_id": oid})
+    oid = _to_object_id(record_id)
+
+    doc = await records.find_one({"_id": oid}, RECORD_PROJECTION)
 
     if not doc:
         raise HTTPException(status_code=404, detail="Record not found")
 
-    return clean_mongo_document(doc)
+    return doc
@@ -5,6 +5,7 @@ from app.services import storage_service, schema_service, logs_service
 from app.database import db
 from datetime import datetime
 from typing import Optional
+import asyncio
 import logging
 
 # Use backend-side ETL adapter
@@ -14,6 +15,42 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/upload", tags=["Upload"])
 
+# Records per insert_many call; up to RECORD_INSERT_CONCURRENCY chunks in flight
+RECORD_INSERT_BATCH_SIZE = 1000
+RECORD_INSERT_CONCURRENCY = 4
+
+
+async def _insert_records(docs):
+    """
+    Insert record docs in concurrent unordered chunks and return their ids.
+    If any chunk fails, every doc from this upload is removed again and the
+    first error is raised, so no records are left without a schema_version.
+    """
+    semaphore = asyncio.Semaphore(RECORD_INSERT_CONCURRENCY)
+
+    async def _insert_chunk(chunk):
+        async with semaphore:
+            return await db.records.insert_many(chunk, ordered=False)
+
+    chunks = [
+        docs[i:i + RECORD_INSERT_BATCH_SIZE]
+        for i in range(0, len(docs), RECORD_INSERT_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(
+        *(_insert_chunk(chunk) for chunk in chunks), return_exceptions=True
+    )
+
+    errors = [res for res in results if isinstance(res, BaseException)]
+    if errors:
+        # insert_many assigns _id to every doc client-side, including unsent/failed ones
+        await db.records.delete_many(
+            {"_id": {"$in": [doc["_id"] for doc in docs if "_id" in doc]}}
+        )
+        logger.error(f"Record insert failed in {len(errors)}/{len(chunks)} chunks; rolled back")
+        raise errors[0]
+
+    return [_id for res in results for _id in res.inserted_ids]
+
 
 @router.post("/")
 async def upload_file(
@@ -57,6 +94,7 @@ async def upload_file(
         # ----------------------------------------------------
         structured = etl_result.get("structured_data") or []
         record_ids = []
+        inserted_ids = []
 
         if structured:
             docs = [
@@ -68,8 +106,8 @@ async def upload_file(
                 }
                 for row in structured
             ]
-            res = await db.records.insert_many(docs)
-            record_ids = [str(_id) for _id in res.inserted_ids]
+            inserted_ids = await _insert_records(docs)
+            record_ids = [str(_id) for _id in inserted_ids]
 
         # ----------------------------------------------------
         # 5. Save schema version
@@ -82,7 +120,7 @@ async def upload_file(
         # ----------------------------------------------------
         if record_ids and sv and sv.get("schema_version"):
             await db.records.update_many(
-                {"_id": {"$in": res.inserted_ids}},
+                {"_id": {"$in": inserted_ids}},
                 {"$set": {"schema_version": sv["schema_version"]}}
             )
 
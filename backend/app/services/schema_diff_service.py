@@ -9,33 +9,29 @@ def _extract_fields_from_schema(schema_obj: dict) -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict mapping field name to field object
     """
-    fields = {}
-    
     if not schema_obj:
-        return fields
+        return {}
+    
+    schema_fields = schema_obj.get("fields")
     
-    # Handle canonical schema format (from _canonicalize_schema_from_etl)
-    # This has fields as a list of field objects
-    if isinstance(schema_obj.get("fields"), list):
-        for field in schema_obj["fields"]:
-            if isinstance(field, dict):
-                field_name = field.get("name") or field.get("path") or "unknown"
-                fields[field_name] = field
+    # Handle canonical / ETL schema format (fields as a list of field objects)
+    if isinstance(schema_fields, list):
+        fields = {
+            (field.get("name") or field.get("path") or "unknown"): field
+            for field in schema_fields
+            if isinstance(field, dict)
+        }
     
     # Handle legacy format (fields as dict)
-    elif isinstance(schema_obj.get("fields"), dict):
-        for field_name, field_meta in schema_obj["fields"].items():
-            if isinstance(field_meta, dict):
-                fields[field_name] = {**field_meta, "name": field_name}
-            else:
-                fields[field_name] = {"name": field_name, "type": str(field_meta)}
+    elif isinstance(schema_fields, dict):
+        fields = {
+            field_name: {**field_meta, "name": field_name} if isinstance(field_meta, dict)
+            else {"name": field_name, "type": str(field_meta)}
+            for field_name, field_meta in schema_fields.items()
+        }
     
-    # Handle raw ETL schema format (direct fields list)
-    elif isinstance(schema_obj.get("fields"), list):
-        for field in schema_obj["fields"]:
-            if isinstance(field, dict):
-                field_name = field.get("name") or "unknown"
-                fields[field_name] = field
+    else:
+        fields = {}
     
     # Fallback: try to extract from raw_schema if present
     if not fields and isinstance(schema_obj.get("raw_schema"), dict):
@@ -68,27 +64,21 @@ def compare_schemas(old_schema: Optional[dict], new_schema: dict) -> dict:
     old_fields = _extract_fields_from_schema(old_schema) if old_schema else {}
     new_fields = _extract_fields_from_schema(new_schema) if new_schema else {}
     
-    old_names = set(old_fields.keys())
-    new_names = set(new_fields.keys())
-    
-    # Added fields
-    added = [new_fields[name] for name in new_names - old_names]
-    
-    # Removed fields
-    removed = [old_fields[name] for name in old_names - new_names]
+    # Dict key views support set operations directly
+    added = [new_fields[name] for name in new_fields.keys() - old_fields.keys()]
+    removed = [old_fields[name] for name in old_fields.keys() - new_fields.keys()]
     
     # Changed fields (type or nullable changed)
     changed = []
-    for name in old_names & new_names:
+    for name in old_fields.keys() & new_fields.keys():
         old_field = old_fields[name]
         new_field = new_fields[name]
+        old_sig = (old_field.get("type", "string"), old_field.get("nullable", True))
+        new_sig = (new_field.get("type", "string"), new_field.get("nullable", True))
         
-        old_type = old_field.get("type", "string")
-        new_type = new_field.get("type", "string")
-        old_nullable = old_field.get("nullable", True)
-        new_nullable = new_field.get("nullable", True)
-        
-        if old_type != new_type or old_nullable != new_nullable:
+        if old_sig != new_sig:
+            old_type, old_nullable = old_sig
+            new_type, new_nullable = new_sig
             changed.append({
                 "name": name,
                 "field": name,  # Frontend compatibility
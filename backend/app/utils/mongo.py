@@ -1,4 +1,27 @@
 from bson import ObjectId
+from bson.codec_options import TypeDecoder, TypeRegistry
+
+
+class ObjectIdToStr(TypeDecoder):
+    """
+    Decode ObjectId values straight to strings during BSON decoding,
+    so documents need no clean_mongo_document pass afterwards.
+    """
+    bson_type = ObjectId
+
+    def transform_bson(self, value):
+        return str(value)
+
+
+def with_str_object_ids(collection):
+    """
+    Return a view of a (Motor) collection whose reads decode every ObjectId as str.
+    """
+    codec_options = collection.codec_options.with_options(
+        type_registry=TypeRegistry([ObjectIdToStr()])
+    )
+    return collection.with_options(codec_options=codec_options)
+
 
 def clean_mongo_document(doc):
     """
@@ -1,29 +1,103 @@
 import numpy as np
 
-def sanitize_for_mongo(obj):
+# Exact numpy scalar type -> Python converter (type() lookup instead of isinstance chains)
+_SCALAR_MAP = {
+    np.int8: int,
+    np.int16: int,
+    np.int32: int,
+    np.int64: int,
+    np.uint8: int,
+    np.uint16: int,
+    np.uint32: int,
+    np.uint64: int,
+    np.float16: float,
+    np.float32: float,
+    np.float64: float,
+    np.bool_: bool,
+}
+
+
+def _sanitize_scalar(obj):
+    fn = _SCALAR_MAP.get(type(obj))
+    if fn is not None:
+        obj = fn(obj)
+    elif isinstance(obj, np.integer):
+        obj = int(obj)
+    elif isinstance(obj, np.floating):
+        obj = float(obj)
+    elif isinstance(obj, np.bool_):
+        obj = bool(obj)
+
+    # NaN is the only value not equal to itself
+    if isinstance(obj, float) and obj != obj:
+        return None
+    return obj
+
+
+def _sanitize_numeric_array(arr):
     """
-    Recursively convert numpy types into pure Python types
-    so MongoDB can store them.
+    Vectorized conversion for numeric ndarrays; returns None for other dtypes.
+    NaN detection for float arrays runs as a single np.isnan pass.
     """
+    kind = arr.dtype.kind
+    if kind in "iub":
+        return arr.tolist()
+    if kind == "f" and arr.ndim == 1:
+        nan_mask = np.isnan(arr)
+        values = arr.tolist()
+        if not nan_mask.any():
+            return values
+        return [None if is_nan else v for v, is_nan in zip(values, nan_mask.tolist())]
+    return None
+
 
-    # Base conversions
-    if isinstance(obj, (np.integer,)):
-        return int(obj)
-    if isinstance(obj, (np.floating,)):
-        return float(obj)
-    if isinstance(obj, (np.bool_,)):
-        return bool(obj)
+def _as_container(obj):
+    """
+    Return (source_items, empty_target) for dict/list-like values, or None for scalars.
+    """
+    t = type(obj)
+    if t is dict or isinstance(obj, dict):
+        return obj.items(), {}
+    if t is list or t is tuple or isinstance(obj, (list, tuple)):
+        return enumerate(obj), []
     if isinstance(obj, np.ndarray):
-        return [sanitize_for_mongo(v) for v in obj.tolist()]
-    if obj is np.nan:
-        return None
+        values = _sanitize_numeric_array(obj)
+        if values is not None:
+            # Already fully converted: nothing left to walk
+            return (), values
+        return enumerate(obj.tolist()), []
+    return None
 
-    # Dict
-    if isinstance(obj, dict):
-        return {k: sanitize_for_mongo(v) for k, v in obj.items()}
 
-    # List / Tuple
-    if isinstance(obj, (list, tuple)):
-        return [sanitize_for_mongo(v) for v in obj]
+def sanitize_for_mongo(obj):
+    """
+    Convert numpy types (and NaN) nested anywhere in obj into pure Python
+    types so MongoDB can store them.
 
-    return obj
+    Walks dicts/lists with an explicit stack instead of recursion.
+    """
+    container = _as_container(obj)
+    if container is None:
+        return _sanitize_scalar(obj)
+
+    items, root = container
+    stack = [(items, root)]
+
+    while stack:
+        items, target = stack.pop()
+        is_dict = isinstance(target, dict)
+
+        for key, value in items:
+            child = _as_container(value)
+            if child is None:
+                value = _sanitize_scalar(value)
+            else:
+                child_items, value = child
+                stack.append((child_items, value))
+
+            if is_dict:
+                target[key] = value
+            else:
+                target.append(value)
+
+    return root